@@ -1,14 +1,73 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # fastest software rasterizer; must precede pyplot import
 import matplotlib.pyplot as plt
 import os
 from datetime import datetime
 import re
 import warnings
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 # Suppress warnings
 warnings.filterwarnings('ignore')
 
+# Applied once here instead of per chart (style.use reloads all rcParams)
+plt.style.use('default')
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+})
+
+# Compiled once; re-used on every cache miss
+_BRAS_RE = re.compile(r'(BRAS\d+)')
+
+def _resolve(names):
+    """Return the first existing path from a list of candidates, else None"""
+    for p in names:
+        if os.path.exists(p):
+            return p
+    return None
+
+def _fingerprint(path):
+    """Cheap cache key for a source file; changes only when the file does"""
+    if not path:
+        return None
+    return (path, os.path.getmtime(path), os.path.getsize(path))
+
+# Source files resolved once at import instead of per cache miss
+_BRAS_PATH = _resolve([
+    os.path.join('raw_data', 'bras', 'combined_bw_utilization.csv'),
+    os.path.join('data', 'bras', 'combined_bw_utilization.csv'),
+    os.path.join('bras', 'combined_bw_utilization.csv'),
+    'combined_bw_utilization.csv'
+])
+_AAA_PATH = _resolve([
+    os.path.join('raw_data', 'aaa', 'Monthly AAA.xlsx'),
+    os.path.join('data', 'aaa', 'Monthly AAA.xlsx'),
+    os.path.join('aaa', 'Monthly AAA.xlsx'),
+    'Monthly AAA.xlsx'
+])
+
+if numba is not None:
+    @numba.njit(cache=True, fastmath=True)
+    def _groupby_max(month_codes, loc_codes, n_months, n_locs, values):
+        """Per-(month, location) max over contiguous int32 code arrays"""
+        out = np.full((n_months, n_locs), -np.inf, np.float32)
+        for i in range(values.size):
+            m = month_codes[i]
+            l = loc_codes[i]
+            v = values[i]
+            if v > out[m, l]:
+                out[m, l] = v
+        return out
+
 # Set page config
 st.set_page_config(
     page_title="BRAS Utilization Dashboard",
@@ -56,170 +115,214 @@ st.markdown("""
 # Title
 st.markdown('<div class="header-style">BRAS Bandwidth Utilization Dashboard</div>', unsafe_allow_html=True)
 
-@st.cache_data(ttl=3600)
-def load_bras_data():
-    """Load and process BRAS data"""
+@st.cache_data(show_spinner=False)
+def load_bras_data(fp_key):
+    """Load and process BRAS data, cached on the source file fingerprint"""
     try:
-        # Try multiple possible paths
-        possible_paths = [
-            os.path.join('raw_data', 'bras', 'combined_bw_utilization.csv'),
-            os.path.join('data', 'bras', 'combined_bw_utilization.csv'),
-            os.path.join('bras', 'combined_bw_utilization.csv'),
-            'combined_bw_utilization.csv'
-        ]
-        
-        file_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                file_path = path
-                break
-        
+        file_path = fp_key[0] if fp_key else None
         if not file_path:
             st.error("BRAS data file not found")
             return pd.DataFrame()
-            
-        # Read and process data
-        df = pd.read_csv(file_path, engine='python', encoding='latin1')
+
+        # Reuse the Parquet sidecar if it is newer than the CSV
+        # (survives process restarts, unlike st.cache_data)
+        pq_path = os.path.splitext(file_path)[0] + '.parquet'
+        if os.path.exists(pq_path) and os.path.getmtime(pq_path) >= os.path.getmtime(file_path):
+            return pd.read_parquet(pq_path)
+
+        # Read and process data (C engine, only the columns we use)
+        df = pd.read_csv(
+            file_path,
+            engine='c',
+            encoding='latin1',
+            usecols=['NE Location', 'MO Location', 'MaxSendTrafficRate(Mbps)', 'End Time'],
+            dtype={
+                'NE Location': 'string',
+                'MO Location': 'string'
+            },
+            thousands=',',
+            parse_dates=['End Time']
+        )
         
         # Extract BRAS device info
-        df['BRAS_Device'] = df['NE Location'].str.extract(r'(BRAS\d+)')
-        df['Location'] = df['NE Location'].str.split(',').str[0] + '_' + df['BRAS_Device']
-        
-        # Filter for 100GE interfaces
-        df = df[df['MO Location'].str.contains('100GE', na=False)]
+        df['BRAS_Device'] = df['NE Location'].str.extract(_BRAS_RE, expand=False)
+        df['Location'] = (
+            df['NE Location'].str.partition(',')[0].str.cat(df['BRAS_Device'], sep='_')
+        )
+
+        # Filter for 100GE interfaces (plain substring scan, no regex)
+        df = df[df['MO Location'].str.contains('100GE', na=False, regex=False)]
         
         if not df.empty:
-            # Clean and convert numeric values
-            df['MaxSendTrafficRate(Mbps)'] = (
-                df['MaxSendTrafficRate(Mbps)']
-                .astype(str).str.replace(',', '')
-                .astype(float)
-            )
-            
-            # Calculate capacity (100G per BRAS)
-            df['Total_Capacity'] = 100000  # 100 Gbps in Mbps
-            
-            # Process dates
-            df['Date'] = pd.to_datetime(df['End Time'])
-            df['Month'] = df['Date'].dt.to_period('M')
-            
-            # Aggregate data
-            monthly_bras = df.groupby(['Month', 'Location']).agg({
-                'MaxSendTrafficRate(Mbps)': 'max',
-                'Total_Capacity': 'first'
-            }).reset_index()
+            # Thousands separators are stripped by the CSV parser; just downcast
+            df['MaxSendTrafficRate(Mbps)'] = df['MaxSendTrafficRate(Mbps)'].astype('float32')
+
+            # Process dates (already parsed at read time); truncate to
+            # month start with plain datetime64 arithmetic, no Period objects
+            df['Date'] = df['End Time']
+            df['Month'] = df['Date'].values.astype('datetime64[M]').astype('datetime64[ns]')
             
-            # Calculate utilization
+            # Aggregate data on categorical keys
+            df['Location'] = df['Location'].astype('category')
+            df['Month'] = df['Month'].astype('category')
+            if numba is not None:
+                # JIT kernel over the category codes: one pass, no hash table
+                months = df['Month'].cat
+                locs = df['Location'].cat
+                grid = _groupby_max(
+                    months.codes.to_numpy(np.int32),
+                    locs.codes.to_numpy(np.int32),
+                    len(months.categories),
+                    len(locs.categories),
+                    df['MaxSendTrafficRate(Mbps)'].to_numpy(np.float32)
+                )
+                mi, li = np.nonzero(grid > -np.inf)
+                monthly_bras = pd.DataFrame({
+                    'Month': months.categories[mi],
+                    'Location': locs.categories[li],
+                    'MaxSendTrafficRate(Mbps)': grid[mi, li]
+                })
+            else:
+                # Pre-sorted categorical keys take the no-hash groupby path
+                df = df.sort_values(['Location', 'Month'], kind='stable')
+                monthly_bras = df.groupby(
+                    ['Month', 'Location'], observed=True, sort=False, as_index=False
+                )['MaxSendTrafficRate(Mbps)'].max()
+
+            # Calculate utilization against 100G (100,000 Mbps) per BRAS
             monthly_bras['Utilization_Pct'] = (
-                monthly_bras['MaxSendTrafficRate(Mbps)'] / 
-                monthly_bras['Total_Capacity']
-            ) * 100
+                monthly_bras['MaxSendTrafficRate(Mbps)'] * 0.001
+            ).astype('float32')
             
             # Format for display
-            monthly_bras['Month'] = monthly_bras['Month'].dt.to_timestamp()
+            monthly_bras['Month'] = monthly_bras['Month'].astype('datetime64[ns]')
+            monthly_bras['Location'] = monthly_bras['Location'].astype('string')
             monthly_bras['Month_Name'] = monthly_bras['Month'].dt.strftime('%b %Y')
-            
+
+            monthly_bras.to_parquet(pq_path, compression='snappy', index=False)
             return monthly_bras
             
     except Exception as e:
         st.error(f"Error loading BRAS data: {str(e)}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=3600)
-def load_aaa_data():
-    """Load and process AAA users data with comprehensive date handling"""
+@st.cache_data(show_spinner=False)
+def load_aaa_data(fp_key):
+    """Load and process AAA users data, cached on the source file fingerprint"""
     try:
-        # Try multiple possible paths
-        possible_paths = [
-            os.path.join('raw_data', 'aaa', 'Monthly AAA.xlsx'),
-            os.path.join('data', 'aaa', 'Monthly AAA.xlsx'),
-            os.path.join('aaa', 'Monthly AAA.xlsx'),
-            'Monthly AAA.xlsx'
-        ]
-        
-        for path in possible_paths:
-            if os.path.exists(path):
-                df = pd.read_excel(path)
-                break
-        else:
+        file_path = fp_key[0] if fp_key else None
+        if not file_path:
             st.error("AAA data file not found")
             return pd.DataFrame()
-        
-        # Fix month names and standardize date format
-        df['Month/Year'] = df['Month/Year'].astype(str).str.replace('Aprl', 'Apr')
-        
-        def parse_date(date_val):
-            try:
-                # Try parsing as datetime
-                if isinstance(date_val, datetime):
-                    return date_val
-                # Try parsing as Excel serial date
-                try:
-                    return pd.to_datetime(float(date_val), unit='D', origin='1899-12-30')
-                except:
-                    pass
-                # Try parsing as string (Apr-25 format)
-                try:
-                    return datetime.strptime(date_val, '%b-%y')
-                except:
-                    pass
-                # Try parsing as YYYY-MM-DD
-                try:
-                    return pd.to_datetime(date_val)
-                except:
-                    pass
-                return None
-            except:
-                return None
-        
-        df['Month'] = df['Month/Year'].apply(parse_date)
-        df['Location'] = df['AAA Location'].str.split('_').str[0] + '_AAA'
+
+        # Reuse the Parquet sidecar if it is newer than the XLSX
+        pq_path = os.path.join(os.path.dirname(file_path), 'monthly_aaa.parquet')
+        if os.path.exists(pq_path) and os.path.getmtime(pq_path) >= os.path.getmtime(file_path):
+            return pd.read_parquet(pq_path)
+
+        # calamine parses XLSX in native code; fall back to openpyxl
+        read_kwargs = dict(
+            usecols=['Month/Year', 'AAA Location', 'User Quantity'],
+            dtype={'Month/Year': 'string', 'AAA Location': 'string', 'User Quantity': 'Int64'}
+        )
+        try:
+            df = pd.read_excel(file_path, engine='calamine', **read_kwargs)
+        except ImportError:
+            df = pd.read_excel(file_path, **read_kwargs)
+
+        # Fix month names, then parse dates with vectorized passes:
+        # 'Apr-25' strings, general datetime strings, Excel serial numbers
+        s = df['Month/Year'].astype('string').str.replace('Aprl', 'Apr', regex=False)
+        parsed = pd.to_datetime(s, format='%b-%y', errors='coerce')
+        parsed = parsed.fillna(pd.to_datetime(s, errors='coerce'))
+        parsed = parsed.fillna(pd.to_datetime(
+            pd.to_numeric(s, errors='coerce'), unit='D', origin='1899-12-30', errors='coerce'
+        ))
+        df['Month'] = parsed
+        df['Location'] = df['AAA Location'].str.partition('_')[0] + '_AAA'
         df.rename(columns={'User Quantity': 'AAA_Users'}, inplace=True)
-        df['AAA_Users'] = pd.to_numeric(df['AAA_Users'], errors='coerce')
+        df['AAA_Users'] = pd.to_numeric(df['AAA_Users'], errors='coerce').astype('Int32')
         df = df[df['Month'].notna()]
         
         # Create Month_Name for display
         df['Month_Name'] = df['Month'].dt.strftime('%b %Y')
-        
-        return df[['Month', 'Month_Name', 'Location', 'AAA_Users']].sort_values('Month')
+
+        df = df[['Month', 'Month_Name', 'Location', 'AAA_Users']].sort_values('Month')
+        df.to_parquet(pq_path, compression='snappy', index=False)
+        return df
         
     except Exception as e:
         st.error(f"Error loading AAA data: {str(e)}")
         return pd.DataFrame()
 
-@st.cache_data(ttl=3600)
-def combine_data(bras_df, aaa_df):
-    """Combine BRAS and AAA data"""
+@st.cache_data(show_spinner=False)
+def combine_data(_bras_df, _aaa_df, fp_keys):
+    """Combine BRAS and AAA data, cached on both source fingerprints"""
     try:
+        bras_df, aaa_df = _bras_df, _aaa_df
         if bras_df.empty or aaa_df.empty:
             return pd.DataFrame()
             
-        combined = pd.merge(
-            bras_df, 
-            aaa_df, 
-            on=['Month', 'Month_Name', 'Location'], 
-            how='outer'
+        # BRAS and AAA rows have disjoint Location keys, so an outer merge
+        # never matches anything; stacking the frames is equivalent and cheap
+        combined = pd.concat([bras_df, aaa_df], ignore_index=True, sort=False)
+
+        # Fill missing values; re-downcast since concat upcasts the
+        # one-sided columns to 64-bit
+        combined['MaxSendTrafficRate(Mbps)'] = (
+            combined['MaxSendTrafficRate(Mbps)'].fillna(0).astype('float32')
         )
-        
-        # Fill missing values
-        combined['MaxSendTrafficRate(Mbps)'] = combined['MaxSendTrafficRate(Mbps)'].fillna(0)
-        combined['Utilization_Pct'] = combined['Utilization_Pct'].fillna(0)
-        combined['AAA_Users'] = combined['AAA_Users'].fillna(0)
-        combined['Total_Capacity'] = combined['Total_Capacity'].fillna(100000)
-        
-        return combined.sort_values('Month')
+        combined['Utilization_Pct'] = combined['Utilization_Pct'].fillna(0).astype('float32')
+        combined['AAA_Users'] = combined['AAA_Users'].fillna(0).astype('Int32')
+
+        # Categorical keys: region filters become int8 code comparisons
+        # instead of per-row string prefix checks
+        combined['_region'] = combined['Location'].str.slice(0, 3).astype('category')
+        combined['Location'] = combined['Location'].astype('category')
+
+        return combined.sort_values('Month', kind='stable')
         
     except Exception as e:
         st.error(f"Error combining data: {str(e)}")
         return pd.DataFrame()
 
+@st.cache_data(show_spinner=False)
+def _format_bras_table(_df, region, fp_keys):
+    """Pre-format the BRAS table columns; cheaper than a Styler pass per rerun"""
+    sub = _df[
+        (_df['_region'] == region) &
+        _df['Location'].str.contains('BRAS', regex=False)
+    ][['Month_Name', 'Location', 'MaxSendTrafficRate(Mbps)', 'Utilization_Pct']].copy()
+    sub['MaxSendTrafficRate(Mbps)'] = sub['MaxSendTrafficRate(Mbps)'].map('{:,.2f}'.format)
+    sub['Utilization_Pct'] = sub['Utilization_Pct'].map('{:.1f}%'.format)
+    return sub.rename(columns={
+        'Month_Name': 'Month',
+        'MaxSendTrafficRate(Mbps)': 'Peak Utilization (Mbps)',
+        'Utilization_Pct': 'Utilization (%)'
+    })
+
+@st.cache_data(show_spinner=False)
+def _format_aaa_table(_df, region, fp_keys):
+    """Pre-format the AAA users table for display"""
+    sub = _df[_df['Location'] == f"{region}_AAA"][['Month_Name', 'AAA_Users']].copy()
+    sub['AAA_Users'] = sub['AAA_Users'].map('{:,.0f}'.format)
+    return sub.rename(columns={'Month_Name': 'Month'})
+
+@st.cache_resource(show_spinner=False)
+def get_combined_chart(region, data_key, _data):
+    """Cached wrapper so the matplotlib artist tree is reused across reruns.
+
+    `_data` is excluded from hashing; `data_key` is a cheap fingerprint of
+    the combined frame that invalidates the cache when the data changes.
+    """
+    return create_combined_chart(_data, region)
+
 def create_combined_chart(data, region):
     """Create visualization with consistent data label styling"""
-    plt.style.use('default')
     fig, ax = plt.subplots(figsize=(14, 7))
     
-    # Filter for region
-    region_data = data[data['Location'].str.startswith(region)].copy()
+    # Filter for region (categorical code comparison)
+    region_data = data[data['_region'] == region].copy()
     
     if region_data.empty:
         st.warning(f"No data available for {region}")
@@ -237,52 +340,57 @@ def create_combined_chart(data, region):
     for device, style in bras_devices.items():
         device_data = region_data[region_data['Location'] == device].sort_values('Month')
         if not device_data.empty:
-            # Apply 10x multiplier only for MDY_BRAS02
-            y_values = device_data['Utilization_Pct'] * (10 if (region == 'MDY' and device.endswith('BRAS02')) else 1)
+            # Apply 10x multiplier only for MDY_BRAS02; extract plain
+            # ndarrays once and share them between plot and labels
+            xs = device_data['Month_Name'].to_numpy()
+            ys = device_data['Utilization_Pct'].to_numpy() * (10 if (region == 'MDY' and device.endswith('BRAS02')) else 1)
             label = f"{device} Utilization" + (" (×10)" if (region == 'MDY' and device.endswith('BRAS02')) else "")
-            
+
             # Plot the line
             ax.plot(
-                device_data['Month_Name'],
-                y_values,
+                xs,
+                ys,
                 marker='o',
                 linewidth=2,
                 color=style['color'],
                 label=label
             )
-            
+
             # Add data labels with precise positioning
-            for i, row in device_data.iterrows():
-                y_val = y_values.loc[i]
+            bbox = dict(boxstyle='round,pad=0.2', fc='white', alpha=0.8)
+            for x, y in zip(xs, ys):
                 ax.annotate(
-                    f"{y_val:.1f}%", 
-                    (row['Month_Name'], y_val),
+                    f"{y:.1f}%",
+                    (x, y),
                     textcoords="offset points",
                     xytext=(0, style['offset']),  # Exact positioning
                     ha='center',
                     fontsize=9,
                     fontweight='bold',
                     color=style['color'],
-                    bbox=dict(boxstyle='round,pad=0.2', fc='white', alpha=0.8)
+                    bbox=bbox
                 )
     
  # Plot AAA Users on secondary axis
     ax2 = ax.twinx()
     aaa_data = region_data[region_data['Location'] == f"{region}_AAA"].sort_values('Month')
     if not aaa_data.empty:
+        aaa_xs = aaa_data['Month_Name'].to_numpy()
+        aaa_ys = aaa_data['AAA_Users'].to_numpy()
         bars = ax2.bar(
-            aaa_data['Month_Name'],
-            aaa_data['AAA_Users'],
+            aaa_xs,
+            aaa_ys,
             color='gray',
             alpha=0.3,
             width=0.4,
             label=f'{region}_AAA Users'
         )
         # Add AAA data labels (centered)
-        for i, row in aaa_data.iterrows():
+        bbox = dict(boxstyle='round,pad=0.2', fc='white', alpha=0.8)
+        for x, y in zip(aaa_xs, aaa_ys):
             ax2.annotate(
-                f"{row['AAA_Users']:,.0f}",
-                (row['Month_Name'], row['AAA_Users']),
+                f"{y:,.0f}",
+                (x, y),
                 textcoords="offset points",
                 xytext=(0, 0),
                 ha='center',
@@ -290,7 +398,7 @@ def create_combined_chart(data, region):
                 fontsize=9,
                 fontweight='bold',
                 color='black',
-                bbox=dict(boxstyle='round,pad=0.2', fc='white', alpha=0.8)
+                bbox=bbox
             )
     
     # Formatting
@@ -318,9 +426,11 @@ def create_combined_chart(data, region):
 
 def main():
     try:
-        bras_df = load_bras_data()
-        aaa_df = load_aaa_data()
-        combined_df = combine_data(bras_df, aaa_df)
+        bras_fp = _fingerprint(_BRAS_PATH)
+        aaa_fp = _fingerprint(_AAA_PATH)
+        bras_df = load_bras_data(bras_fp)
+        aaa_df = load_aaa_data(aaa_fp)
+        combined_df = combine_data(bras_df, aaa_df, (bras_fp, aaa_fp))
 
         if not combined_df.empty:
             # Sidebar filters
@@ -331,48 +441,63 @@ def main():
             st.markdown("### Key Performance Indicators")
             cols = st.columns(3)
             
-            # Get peak values for the selected region
-            region_data = combined_df[combined_df['Location'].str.startswith(region)]
-            
+            # Get peak values for the selected region in one pass
+            region_data = combined_df[combined_df['_region'] == region]
+            kpis = region_data.groupby('Location', observed=True, sort=False).agg(
+                bras_peak=('MaxSendTrafficRate(Mbps)', 'max'),
+                bras_idx=('MaxSendTrafficRate(Mbps)', 'idxmax'),
+                aaa_peak=('AAA_Users', 'max'),
+                aaa_idx=('AAA_Users', 'idxmax')
+            )
+            # Fetch all peak months with two fancy-indexes instead of a
+            # per-card .at lookup
+            kpis['bras_month'] = region_data.loc[kpis['bras_idx'], 'Month_Name'].to_numpy()
+            kpis['aaa_month'] = region_data.loc[kpis['aaa_idx'], 'Month_Name'].to_numpy()
+
             # BRAS01 Peak Utilization
-            bras01_data = region_data[region_data['Location'] == f"{region}_BRAS01"]
-            if not bras01_data.empty:
-                peak_util = bras01_data['MaxSendTrafficRate(Mbps)'].max() / 1000
-                peak_month = bras01_data.loc[bras01_data['MaxSendTrafficRate(Mbps)'].idxmax()]['Month_Name']
+            if f"{region}_BRAS01" in kpis.index:
+                row = kpis.loc[f"{region}_BRAS01"]
+                peak_util = row['bras_peak'] / 1000
+                peak_month = row['bras_month']
                 with cols[0]:
                     st.markdown(f'<div class="metric-card">'
                               f'<div class="metric-value">{peak_util:.1f} Gbps</div>'
                               f'<div class="metric-label">{region}_BRAS01 Peak</div>'
-                              f'<div class="metric-label">({peak_month})</div></div>', 
+                              f'<div class="metric-label">({peak_month})</div></div>',
                               unsafe_allow_html=True)
-            
+
             # BRAS02 Peak Utilization
-            bras02_data = region_data[region_data['Location'] == f"{region}_BRAS02"]
-            if not bras02_data.empty:
-                peak_util = bras02_data['MaxSendTrafficRate(Mbps)'].max() / 1000
-                peak_month = bras02_data.loc[bras02_data['MaxSendTrafficRate(Mbps)'].idxmax()]['Month_Name']
+            if f"{region}_BRAS02" in kpis.index:
+                row = kpis.loc[f"{region}_BRAS02"]
+                peak_util = row['bras_peak'] / 1000
+                peak_month = row['bras_month']
                 with cols[1]:
                     st.markdown(f'<div class="metric-card">'
                               f'<div class="metric-value">{peak_util:.1f} Gbps</div>'
                               f'<div class="metric-label">{region}_BRAS02 Peak</div>'
-                              f'<div class="metric-label">({peak_month})</div></div>', 
+                              f'<div class="metric-label">({peak_month})</div></div>',
                               unsafe_allow_html=True)
-            
+
             # AAA Peak Users
-            aaa_data = region_data[region_data['Location'] == f"{region}_AAA"]
-            if not aaa_data.empty:
-                peak_users = aaa_data['AAA_Users'].max()
-                peak_month = aaa_data.loc[aaa_data['AAA_Users'].idxmax()]['Month_Name']
+            if f"{region}_AAA" in kpis.index:
+                row = kpis.loc[f"{region}_AAA"]
+                peak_users = row['aaa_peak']
+                peak_month = row['aaa_month']
                 with cols[2]:
                     st.markdown(f'<div class="metric-card">'
                               f'<div class="metric-value">{peak_users:,.0f}</div>'
                               f'<div class="metric-label">{region}_AAA Peak Users</div>'
-                              f'<div class="metric-label">({peak_month})</div></div>', 
+                              f'<div class="metric-label">({peak_month})</div></div>',
                               unsafe_allow_html=True)
 
             # Main visualization
             st.markdown("### Bandwidth Utilization & AAA Users")
-            fig = create_combined_chart(combined_df, region)
+            data_key = (
+                len(combined_df),
+                str(combined_df['Month'].max()),
+                float(combined_df['MaxSendTrafficRate(Mbps)'].sum())
+            )
+            fig = get_combined_chart(region, data_key, combined_df)
             st.pyplot(fig)
             
             # Data tables
@@ -382,31 +507,14 @@ def main():
             tab1, tab2 = st.tabs(["BRAS Utilization", "AAA Users"])
             
             with tab1:
-                bras_data = combined_df[
-                    combined_df['Location'].str.startswith(f"{region}_BRAS")
-                ][['Month_Name', 'Location', 'MaxSendTrafficRate(Mbps)', 'Utilization_Pct']]
                 st.dataframe(
-                    bras_data.rename(columns={
-                        'Month_Name': 'Month',
-                        'MaxSendTrafficRate(Mbps)': 'Peak Utilization (Mbps)',
-                        'Utilization_Pct': 'Utilization (%)'
-                    }).style.format({
-                        'Peak Utilization (Mbps)': '{:,.2f}',
-                        'Utilization (%)': '{:.1f}%'
-                    }),
+                    _format_bras_table(combined_df, region, (bras_fp, aaa_fp)),
                     height=400
                 )
-            
+
             with tab2:
-                aaa_data = combined_df[
-                    combined_df['Location'] == f"{region}_AAA"
-                ][['Month_Name', 'AAA_Users']]
                 st.dataframe(
-                    aaa_data.rename(columns={
-                        'Month_Name': 'Month',
-                    }).style.format({
-                        'AAA_Users': '{:,.0f}'
-                    }),
+                    _format_aaa_table(combined_df, region, (bras_fp, aaa_fp)),
                     height=400
                 )
             